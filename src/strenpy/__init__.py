@@ -13,14 +13,17 @@ from strenpy.calculations import (
     calculate_engineering_strain,
     calculate_engineering_stress,
     calculate_youngs_modulus,
+    calculate_youngs_moduli,
     calculate_offset_yield_stress,
     calculate_uts,
     calculate_true_stress,
     calculate_true_strain,
+    calculate_true_stress_strain,
     fit_power_law,
     calculate_strain_energy,
     calculate_modulus_of_resilience,
     calculate_modulus_of_toughness,
+    calculate_tensile_properties,
     calculate_necking_strain_from_n,
 )
 from strenpy.visualizations import (
@@ -36,14 +39,17 @@ __all__ = [
     "calculate_engineering_strain",
     "calculate_engineering_stress",
     "calculate_youngs_modulus",
+    "calculate_youngs_moduli",
     "calculate_offset_yield_stress",
     "calculate_uts",
     "calculate_true_stress",
     "calculate_true_strain",
+    "calculate_true_stress_strain",
     "fit_power_law",
     "calculate_strain_energy",
     "calculate_modulus_of_resilience",
     "calculate_modulus_of_toughness",
+    "calculate_tensile_properties",
     "calculate_necking_strain_from_n",
     "plot_engineering_stress_strain",
     "plot_engineering_vs_true",
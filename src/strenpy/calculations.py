@@ -6,6 +6,7 @@ MIT Department of Materials Science and Engineering
 """
 
 import numpy as np
+from numba import njit
 from numpy.typing import NDArray
 
 
@@ -25,12 +26,56 @@ def calculate_engineering_stress(
     return load / original_area
 
 
+def _linear_fit(
+    x: NDArray[np.floating], y: NDArray[np.floating]
+) -> tuple[float, float]:
+    """Least-squares line y = slope·x + intercept via closed-form cov(x, y)/var(x)."""
+    if len(x) < 2:
+        raise ValueError("Linear fit needs at least two points")
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    x_mean = x.mean()
+    y_mean = y.mean()
+    dx = x - x_mean
+    slope = float(np.dot(dx, y - y_mean) / np.dot(dx, dx))
+    return slope, float(y_mean - slope * x_mean)
+
+
 def calculate_youngs_modulus(
     stress: NDArray[np.floating], strain: NDArray[np.floating], elastic_points: int = 20
 ) -> float:
     """Calculate Young's Modulus from linear elastic region."""
-    coeffs = np.polyfit(strain[:elastic_points], stress[:elastic_points], 1)
-    return coeffs[0]
+    slope, _ = _linear_fit(strain[:elastic_points], stress[:elastic_points])
+    return slope
+
+
+def calculate_youngs_moduli(
+    stresses: list[NDArray[np.floating]],
+    strains: list[NDArray[np.floating]],
+    elastic_points: int = 20,
+) -> NDArray[np.floating]:
+    """
+    Calculate Young's Modulus for several curves in one batched least-squares solve.
+
+    Like calculate_youngs_modulus, a curve shorter than elastic_points is fitted
+    over all of its samples; the zero-padded rows drop out of the normal equations.
+    """
+    counts = np.array([min(len(strain), elastic_points) for strain in strains])
+    if counts.min() < 2:
+        raise ValueError("Linear fit needs at least two points")
+
+    x = np.zeros((len(strains), counts.max()))
+    y = np.zeros((len(stresses), counts.max()))
+    for i, (strain, stress) in enumerate(zip(strains, stresses)):
+        x[i, : counts[i]] = strain[: counts[i]]
+        y[i, : counts[i]] = stress[: counts[i]]
+    mask = np.arange(counts.max()) < counts[:, None]
+
+    X = np.stack([x, mask.astype(np.float64)], axis=-1)
+    Xt = X.transpose(0, 2, 1)
+    coeffs = np.linalg.solve(Xt @ X, Xt @ y[..., None])
+    return coeffs[:, 0, 0]
 
 
 def calculate_offset_yield_stress(
@@ -43,10 +88,15 @@ def calculate_offset_yield_stress(
     Calculate offset yield stress by finding intersection of stress-strain curve
     with a line of slope E offset by the specified strain (default 0.2%).
     """
-    offset_line_stress = youngs_modulus * (strain - offset)
+    return _offset_yield_scan(stress, strain, youngs_modulus, offset)
 
-    for i in range(len(stress) - 1):
-        if offset_line_stress[i] >= 0 and stress[i] >= offset_line_stress[i]:
+
+@njit(cache=True)
+def _offset_yield_scan(stress, strain, youngs_modulus, offset):
+    """Single-pass scan for the first point on or above the offset line."""
+    for i in range(stress.size):
+        offset_line_stress = youngs_modulus * (strain[i] - offset)
+        if offset_line_stress >= 0 and stress[i] >= offset_line_stress:
             return stress[i], strain[i]
 
     return stress[-1], strain[-1]
@@ -68,7 +118,30 @@ def calculate_true_stress(
 def calculate_true_strain(
     engineering_strain: NDArray[np.floating],
 ) -> NDArray[np.floating]:
-    return np.log(1 + engineering_strain)
+    return np.log1p(engineering_strain)
+
+
+def calculate_true_stress_strain(
+    engineering_stress: NDArray[np.floating], engineering_strain: NDArray[np.floating]
+) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
+    """Convert engineering curve to true stress and true strain in one pass."""
+    dtype = np.result_type(engineering_stress, engineering_strain, np.float32)
+    return _true_curves(
+        np.asarray(engineering_stress, dtype=dtype),
+        np.asarray(engineering_strain, dtype=dtype),
+    )
+
+
+@njit(cache=True)
+def _true_curves(engineering_stress, engineering_strain):
+    """Fused kernel: one read of each input point, one write of each output."""
+    true_stress = np.empty_like(engineering_stress)
+    true_strain = np.empty_like(engineering_strain)
+    for i in range(engineering_strain.size):
+        true_stress[i] = engineering_stress[i] * (1 + engineering_strain[i])
+        true_strain[i] = np.log1p(engineering_strain[i])
+
+    return true_stress, true_strain
 
 
 def fit_power_law(
@@ -81,37 +154,149 @@ def fit_power_law(
     if end_idx is None:
         end_idx = len(true_stress)
 
-    mask = (true_strain[start_idx:end_idx] > 0) & (true_stress[start_idx:end_idx] > 0)
-    log_strain = np.log(true_strain[start_idx:end_idx][mask])
-    log_stress = np.log(true_stress[start_idx:end_idx][mask])
+    count, n, log_A = _loglog_fit(
+        true_stress[start_idx:end_idx], true_strain[start_idx:end_idx]
+    )
+    if count < 2:
+        raise ValueError("Linear fit needs at least two points")
+    if np.isnan(n):
+        raise ValueError("Linear fit needs at least two distinct strain values")
 
-    coeffs = np.polyfit(log_strain, log_stress, 1)
-    n = coeffs[0]
-    log_A = coeffs[1]
     A = np.exp(log_A)
 
     return A, n
 
 
+@njit(cache=True)
+def _loglog_fit(stress, strain):
+    """
+    Least-squares line through (ln ε, ln σ) for positive points, in one pass.
+
+    Uses Welford-style running means and co-moments, so no masked or logged
+    temporaries are allocated.
+    """
+    count = 0
+    mean_x = 0.0
+    mean_y = 0.0
+    sxx = 0.0
+    sxy = 0.0
+    for i in range(stress.size):
+        if strain[i] > 0 and stress[i] > 0:
+            x = np.log(strain[i])
+            y = np.log(stress[i])
+            count += 1
+            dx = x - mean_x
+            mean_x += dx / count
+            mean_y += (y - mean_y) / count
+            sxx += dx * (x - mean_x)
+            sxy += dx * (y - mean_y)
+
+    if count < 2 or sxx == 0:
+        return count, np.nan, np.nan
+
+    slope = sxy / sxx
+    return count, slope, mean_y - slope * mean_x
+
+
+@njit(cache=True)
+def _trapezoid(y, dx):
+    """Trapezoidal integral of y over precomputed increments dx = np.diff(x)."""
+    total = 0.0
+    for i in range(dx.size):
+        total += (y[i] + y[i + 1]) * dx[i]
+    return 0.5 * total
+
+
 def calculate_strain_energy(
-    stress: NDArray[np.floating], strain: NDArray[np.floating]
+    stress: NDArray[np.floating],
+    strain: NDArray[np.floating],
+    dx: NDArray[np.floating] | None = None,
 ) -> float:
     """Calculate strain energy as area under stress-strain curve."""
-    return np.trapezoid(stress, strain)
+    if dx is None:
+        dx = np.diff(strain)
+    return _trapezoid(stress, dx)
 
 
 def calculate_modulus_of_resilience(
-    stress: NDArray[np.floating], strain: NDArray[np.floating], yield_idx: int
+    stress: NDArray[np.floating],
+    strain: NDArray[np.floating],
+    yield_idx: int,
+    dx: NDArray[np.floating] | None = None,
 ) -> float:
     """Calculate strain energy up to yield (elastic energy storage capacity)."""
-    return np.trapezoid(stress[: yield_idx + 1], strain[: yield_idx + 1])
+    if dx is None:
+        dx = np.diff(strain[: yield_idx + 1])
+    return _trapezoid(stress[: yield_idx + 1], dx[:yield_idx])
 
 
 def calculate_modulus_of_toughness(
-    stress: NDArray[np.floating], strain: NDArray[np.floating]
+    stress: NDArray[np.floating],
+    strain: NDArray[np.floating],
+    dx: NDArray[np.floating] | None = None,
 ) -> float:
     """Calculate total strain energy to fracture (impact resistance)."""
-    return np.trapezoid(stress, strain)
+    return calculate_strain_energy(stress, strain, dx)
+
+
+def calculate_tensile_properties(
+    strain_mat: NDArray[np.floating],
+    stress_mat: NDArray[np.floating],
+    lengths: NDArray[np.integer],
+    youngs_moduli: NDArray[np.floating],
+    offset: float = 0.002,
+) -> tuple[NDArray, ...]:
+    """
+    Calculate yield and strain energies for every row of NaN-padded curves.
+
+    Row i holds a curve of lengths[i] samples followed by padding. Returns
+    per-row arrays (yield stress, yield strain, yield index, resilience,
+    toughness) from a single compiled call.
+    """
+    return _tensile_properties(
+        strain_mat, stress_mat, np.asarray(lengths), youngs_moduli, offset
+    )
+
+
+@njit(cache=True)
+def _nearest_index(x, value):
+    """Index of the sample in sorted x nearest to value; ties go to the first index."""
+    idx = np.searchsorted(x, value)
+    if idx == x.size or (idx > 0 and value - x[idx - 1] <= x[idx] - value):
+        idx = np.searchsorted(x, x[idx - 1])
+    return idx
+
+
+@njit(cache=True)
+def _tensile_properties(strain_mat, stress_mat, lengths, youngs_moduli, offset):
+    """Row loop over the padded arrays, reusing the per-curve compiled helpers."""
+    count = lengths.size
+    yield_stress = np.empty(count)
+    yield_strain = np.empty(count)
+    yield_idx = np.empty(count, dtype=np.int64)
+    resilience = np.empty(count)
+    toughness = np.empty(count)
+
+    for row in range(count):
+        strain = strain_mat[row, : lengths[row]]
+        stress = stress_mat[row, : lengths[row]]
+
+        yield_stress[row], yield_strain[row] = _offset_yield_scan(
+            stress, strain, youngs_moduli[row], offset
+        )
+        yield_idx[row] = _nearest_index(strain, yield_strain[row])
+
+        dx = np.diff(strain)
+        resilience[row] = _trapezoid(stress[: yield_idx[row] + 1], dx[: yield_idx[row]])
+        toughness[row] = _trapezoid(stress, dx)
+
+    return (
+        yield_stress,
+        yield_strain,
+        yield_idx,
+        resilience,
+        toughness,
+    )
 
 
 def calculate_necking_strain_from_n(n: float) -> float:
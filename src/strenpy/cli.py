@@ -4,20 +4,19 @@ Tensile test analysis CLI.
 Analyzes three copper alloys using real experimental data from KupferDigital.
 """
 
+import os
+import matplotlib
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from numpy.typing import NDArray
 from rich import print
 
 from strenpy import (
-    calculate_youngs_modulus,
-    calculate_offset_yield_stress,
-    calculate_uts,
-    calculate_true_stress,
-    calculate_true_strain,
+    calculate_tensile_properties,
+    calculate_true_stress_strain,
+    calculate_youngs_moduli,
     fit_power_law,
-    calculate_modulus_of_resilience,
-    calculate_modulus_of_toughness,
     plot_engineering_stress_strain,
     plot_engineering_vs_true,
     plot_power_law,
@@ -37,47 +36,98 @@ def analyze_material(
     stress_e: NDArray,
 ) -> dict:
     """Perform complete tensile test analysis and return all calculated properties."""
+    return analyze_materials([name], [strain_e], [stress_e])[0]
+
+
+def analyze_materials(
+    names: list[str],
+    strains_e: list[NDArray],
+    stresses_e: list[NDArray],
+) -> list[dict]:
+    """
+    Analyze several tensile curves at once.
+
+    Curves are stacked into NaN-padded (materials × samples) arrays. UTS and
+    fracture strain are read across all rows at once; yield and strain energies
+    come from one compiled call that takes the padded arrays as its input
+    format. True curves are converted per row up to UTS, so padding never
+    reaches the conversion kernel.
+    """
+    count = len(names)
+    lengths = np.array([len(strain) for strain in strains_e])
+    dtype = np.result_type(np.float32, *strains_e, *stresses_e)
+    strain_mat = np.full((count, lengths.max()), np.nan, dtype=dtype)
+    stress_mat = np.full((count, lengths.max()), np.nan, dtype=dtype)
+    for i, (strain, stress) in enumerate(zip(strains_e, stresses_e)):
+        strain_mat[i, : lengths[i]] = strain
+        stress_mat[i, : lengths[i]] = stress
+    rows = np.arange(count)
+
+    E = calculate_youngs_moduli(stresses_e, strains_e, elastic_points=30)
+    (
+        yield_stress,
+        yield_strain,
+        yield_idx,
+        resilience,
+        toughness,
+    ) = calculate_tensile_properties(
+        strain_mat, stress_mat, lengths, youngs_moduli=E, offset=0.002
+    )
 
-    E = calculate_youngs_modulus(stress_e, strain_e, elastic_points=30)
+    uts_idx = np.nanargmax(stress_mat, axis=1)
+    uts = stress_mat[rows, uts_idx]
+    uts_strain = strain_mat[rows, uts_idx]
+    fracture_strain = strain_mat[rows, lengths - 1]
 
-    yield_stress, yield_strain = calculate_offset_yield_stress(
-        stress_e, strain_e, E, offset=0.002
-    )
+    results = []
+    for i, name in enumerate(names):
+        stress_t, strain_t = calculate_true_stress_strain(
+            stress_mat[i, : uts_idx[i]], strain_mat[i, : uts_idx[i]]
+        )
+
+        try:
+            A, n = fit_power_law(
+                stress_t, strain_t, start_idx=10, end_idx=int(uts_idx[i]) - 10
+            )
+        except Exception:
+            A, n = 0, 0
+
+        results.append(
+            {
+                "name": name,
+                "strain_e": strains_e[i],
+                "stress_e": stresses_e[i],
+                "strain_t": strain_t,
+                "stress_t": stress_t,
+                "E": E[i],
+                "yield_stress": yield_stress[i],
+                "yield_strain": yield_strain[i],
+                "yield_idx": int(yield_idx[i]),
+                "uts": float(uts[i]),
+                "uts_strain": uts_strain[i],
+                "uts_idx": int(uts_idx[i]),
+                "A": A,
+                "n": n,
+                "resilience": float(resilience[i]),
+                "toughness": float(toughness[i]),
+                "fracture_strain": fracture_strain[i],
+            }
+        )
+
+    return results
 
-    uts_value, uts_idx = calculate_uts(stress_e)
-    uts_strain = strain_e[uts_idx]
-
-    strain_t = calculate_true_strain(strain_e[:uts_idx])
-    stress_t = calculate_true_stress(stress_e[:uts_idx], strain_e[:uts_idx])
-
-    try:
-        A, n = fit_power_law(stress_t, strain_t, start_idx=10, end_idx=uts_idx - 10)
-    except Exception:
-        A, n = 0, 0
-
-    yield_idx = int(np.argmin(np.abs(strain_e - yield_strain)))
-    resilience = calculate_modulus_of_resilience(stress_e, strain_e, yield_idx)
-    toughness = calculate_modulus_of_toughness(stress_e, strain_e)
-
-    return {
-        "name": name,
-        "strain_e": strain_e,
-        "stress_e": stress_e,
-        "strain_t": strain_t,
-        "stress_t": stress_t,
-        "E": E,
-        "yield_stress": yield_stress,
-        "yield_strain": yield_strain,
-        "yield_idx": yield_idx,
-        "uts": uts_value,
-        "uts_strain": uts_strain,
-        "uts_idx": uts_idx,
-        "A": A,
-        "n": n,
-        "resilience": resilience,
-        "toughness": toughness,
-        "fracture_strain": strain_e[-1],
-    }
+
+def _write_stress_strain_csv(path: Path, strain: NDArray, stress: NDArray) -> None:
+    """
+    Write strain/stress columns as CSV, formatting all rows in a single pass.
+
+    float32 data is written with 9 significant digits, enough to round-trip
+    exactly without printing float64 widening noise; other data uses %.18e.
+    """
+    data = np.column_stack([strain, stress])
+    fmt = "%.9g" if data.dtype == np.float32 else "%.18e"
+    body = (f"{fmt},{fmt}\n" * len(strain)) % tuple(data.ravel().tolist())
+    path.write_text("strain_e,stress_e_MPa\n" + body)
 
 
 def load_real_alloy_data() -> tuple:
@@ -104,6 +154,8 @@ def load_real_alloy_data() -> tuple:
 
 
 def main():
+    matplotlib.use("Agg")
+
     output_dir = Path("output")
     output_dir.mkdir(exist_ok=True)
 
@@ -123,10 +175,14 @@ def main():
         cuni12al3_stress,
     ) = load_real_alloy_data()
 
+    cu1, cu2, cu3 = analyze_materials(
+        ["CuNiSi", "CuSn12", "CuNi12Al3"],
+        [cunisi_strain, cusn12_strain, cuni12al3_strain],
+        [cunisi_stress, cusn12_stress, cuni12al3_stress],
+    )
+
     print("ANALYZING CuNiSi (Copper-Nickel-Silicon)")
     print("-" * 90)
-    cu1 = analyze_material("CuNiSi", cunisi_strain, cunisi_stress)
-
     print(f"  Young's Modulus E:                {cu1['E'] / 1000:.0f} GPa")
     print(f"  Yield Stress σᵧ (0.2% offset):    {cu1['yield_stress']:.1f} MPa")
     print(f"  Ultimate Tensile Strength σf:     {cu1['uts']:.1f} MPa")
@@ -140,8 +196,6 @@ def main():
 
     print("ANALYZING CuSn12 (Bronze - 12% Tin)")
     print("-" * 90)
-    cu2 = analyze_material("CuSn12", cusn12_strain, cusn12_stress)
-
     print(f"  Young's Modulus E:                {cu2['E'] / 1000:.0f} GPa")
     print(f"  Yield Stress σᵧ (0.2% offset):    {cu2['yield_stress']:.1f} MPa")
     print(f"  Ultimate Tensile Strength σf:     {cu2['uts']:.1f} MPa")
@@ -155,8 +209,6 @@ def main():
 
     print("ANALYZING CuNi12Al3 (Copper-Nickel-Aluminum)")
     print("-" * 90)
-    cu3 = analyze_material("CuNi12Al3", cuni12al3_strain, cuni12al3_stress)
-
     print(f"  Young's Modulus E:                {cu3['E'] / 1000:.0f} GPa")
     print(f"  Yield Stress σᵧ (0.2% offset):    {cu3['yield_stress']:.1f} MPa")
     print(f"  Ultimate Tensile Strength σf:     {cu3['uts']:.1f} MPa")
@@ -170,88 +222,106 @@ def main():
 
     print("SAVING PROCESSED DATA...")
     print("-" * 90)
-    np.savetxt(
-        output_dir / "cunisi_stress_strain.csv",
-        np.column_stack([cu1["strain_e"], cu1["stress_e"]]),
-        delimiter=",",
-        header="strain_e,stress_e_MPa",
-        comments="",
-    )
-    np.savetxt(
-        output_dir / "cusn12_stress_strain.csv",
-        np.column_stack([cu2["strain_e"], cu2["stress_e"]]),
-        delimiter=",",
-        header="strain_e,stress_e_MPa",
-        comments="",
-    )
-    np.savetxt(
-        output_dir / "cuni12al3_stress_strain.csv",
-        np.column_stack([cu3["strain_e"], cu3["stress_e"]]),
-        delimiter=",",
-        header="strain_e,stress_e_MPa",
-        comments="",
-    )
-    print("  ✓ cunisi_stress_strain.csv")
-    print("  ✓ cusn12_stress_strain.csv")
-    print("  ✓ cuni12al3_stress_strain.csv")
+    for filename, result in [
+        ("cunisi_stress_strain.csv", cu1),
+        ("cusn12_stress_strain.csv", cu2),
+        ("cuni12al3_stress_strain.csv", cu3),
+    ]:
+        _write_stress_strain_csv(
+            output_dir / filename, result["strain_e"], result["stress_e"]
+        )
+        print(f"  ✓ {filename}")
     print()
 
     print("GENERATING VISUALIZATIONS...")
     print("-" * 90)
 
-    print("  [1/5] Engineering stress-strain for CuNiSi...")
-    plot_engineering_stress_strain(
-        cu1["strain_e"],
-        cu1["stress_e"],
-        material_name="CuNiSi (Copper-Nickel-Silicon)",
-        youngs_modulus=cu1["E"],
-        yield_point=(cu1["yield_strain"], cu1["yield_stress"]),
-        uts_point=(cu1["uts_strain"], cu1["uts"]),
-        save_path=str(output_dir / "figure_cunisi_engineering.png"),
-    )
-
-    print("  [2/5] Engineering vs True stress-strain for CuSn12...")
-    plot_engineering_vs_true(
-        cu2["strain_e"][: cu2["uts_idx"]],
-        cu2["stress_e"][: cu2["uts_idx"]],
-        cu2["strain_t"],
-        cu2["stress_t"],
-        material_name="CuSn12 Bronze",
-        uts_idx=None,
-        save_path=str(output_dir / "figure_cusn12_eng_vs_true.png"),
-    )
-
-    if cu2["n"] > 0:
-        print("  [3/5] Power-law representation for CuSn12...")
-        plot_power_law(
-            cu2["strain_t"],
-            cu2["stress_t"],
-            cu2["A"],
-            cu2["n"],
-            material_name="CuSn12 Bronze",
-            save_path=str(output_dir / "figure_cusn12_power_law.png"),
+    # At most one worker per figure: with fork, every worker starts up front.
+    with ProcessPoolExecutor(
+        max_workers=min(5, os.cpu_count() or 1),
+        initializer=matplotlib.use,
+        initargs=("Agg",),
+    ) as executor:
+        jobs = [
+            (
+                "[1/5] Engineering stress-strain for CuNiSi",
+                executor.submit(
+                    plot_engineering_stress_strain,
+                    cu1["strain_e"],
+                    cu1["stress_e"],
+                    material_name="CuNiSi (Copper-Nickel-Silicon)",
+                    youngs_modulus=cu1["E"],
+                    yield_point=(cu1["yield_strain"], cu1["yield_stress"]),
+                    uts_point=(cu1["uts_strain"], cu1["uts"]),
+                    save_path=str(output_dir / "figure_cunisi_engineering.png"),
+                ),
+            ),
+            (
+                "[2/5] Engineering vs True stress-strain for CuSn12",
+                executor.submit(
+                    plot_engineering_vs_true,
+                    cu2["strain_e"][: cu2["uts_idx"]],
+                    cu2["stress_e"][: cu2["uts_idx"]],
+                    cu2["strain_t"],
+                    cu2["stress_t"],
+                    material_name="CuSn12 Bronze",
+                    uts_idx=None,
+                    save_path=str(output_dir / "figure_cusn12_eng_vs_true.png"),
+                ),
+            ),
+        ]
+
+        if cu2["n"] > 0:
+            jobs.append(
+                (
+                    "[3/5] Power-law representation for CuSn12",
+                    executor.submit(
+                        plot_power_law,
+                        cu2["strain_t"],
+                        cu2["stress_t"],
+                        cu2["A"],
+                        cu2["n"],
+                        material_name="CuSn12 Bronze",
+                        save_path=str(output_dir / "figure_cusn12_power_law.png"),
+                    ),
+                )
+            )
+
+        jobs.append(
+            (
+                "[4/5] Strain energy for CuNi12Al3",
+                executor.submit(
+                    plot_strain_energy,
+                    cu3["strain_e"],
+                    cu3["stress_e"],
+                    yield_idx=cu3["yield_idx"],
+                    material_name="CuNi12Al3",
+                    save_path=str(output_dir / "figure_strain_energy.png"),
+                ),
+            )
         )
 
-    print("  [4/5] Strain energy for CuNi12Al3...")
-    plot_strain_energy(
-        cu3["strain_e"],
-        cu3["stress_e"],
-        yield_idx=cu3["yield_idx"],
-        material_name="CuNi12Al3",
-        save_path=str(output_dir / "figure_strain_energy.png"),
-    )
+        materials = {
+            "CuNiSi (soft)": (cu1["strain_e"], cu1["stress_e"]),
+            "CuSn12 (medium)": (cu2["strain_e"], cu2["stress_e"]),
+            "CuNi12Al3 (strong)": (cu3["strain_e"], cu3["stress_e"]),
+        }
+        jobs.append(
+            (
+                "[5/5] Material comparison",
+                executor.submit(
+                    plot_material_comparison,
+                    materials,
+                    title="Copper Alloy Comparison: Soft vs Medium vs Strong",
+                    save_path=str(output_dir / "figure_comparison.png"),
+                ),
+            )
+        )
 
-    print("  [5/5] Material comparison...")
-    materials = {
-        "CuNiSi (soft)": (cu1["strain_e"], cu1["stress_e"]),
-        "CuSn12 (medium)": (cu2["strain_e"], cu2["stress_e"]),
-        "CuNi12Al3 (strong)": (cu3["strain_e"], cu3["stress_e"]),
-    }
-    plot_material_comparison(
-        materials,
-        title="Copper Alloy Comparison: Soft vs Medium vs Strong",
-        save_path=str(output_dir / "figure_comparison.png"),
-    )
+        # Report each figure only once its worker has finished writing it.
+        for label, future in jobs:
+            future.result()
+            print(f"  ✓ {label}")
 
     print()
     print("=" * 90)
@@ -4,6 +4,11 @@ Process tensile test data from German .lis files.
 Data source: BAM 5.2 tensile testing system via KupferDigital.
 """
 
+import io
+import os
+import tempfile
+import warnings
+import zipfile
 import numpy as np
 from pathlib import Path
 from numpy.typing import NDArray
@@ -11,62 +16,128 @@ from numpy.typing import NDArray
 
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 
+# Bump when the parsed array layout or dtype changes, to invalidate .npz caches.
+_CACHE_VERSION = 2
+
 
 def parse_lis_file(
     filepath: Path, gauge_length_mm: float = 25.0
 ) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
     """
     Parse German .lis file: calculate strain from displacement, filter negative stress.
+
+    Values are returned as float32: the recorded data carries about four
+    significant figures, so double precision only doubles the memory traffic.
     """
     with open(filepath, "r", encoding="latin-1") as f:
-        lines = f.readlines()
+        text = f.read()
 
-    data_start = None
-    for i, line in enumerate(lines):
-        if "[Daten]" in line:
-            data_start = i + 3
-            break
-
-    if data_start is None:
+    _, found, data_section = text.partition("[Daten]")
+    if not found:
         raise ValueError(f"Could not find [Daten] section in {filepath}")
 
-    displacement_data = []
-    stress_data = []
-
-    for line in lines[data_start:]:
-        line = line.strip()
-        if not line:
-            continue
+    # Skip the rest of the marker line plus the column-name and unit rows. Only
+    # displacement (column 1) and stress (column 4) are ever converted to floats.
+    rows = io.StringIO(data_section.replace(",", "."))
+    try:
+        data = np.loadtxt(
+            rows,
+            delimiter="\t",
+            usecols=(1, 4),
+            skiprows=3,
+            ndmin=2,
+            dtype=np.float32,
+        )
+    except ValueError:
+        rows.seek(0)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            data = np.genfromtxt(
+                rows,
+                delimiter="\t",
+                usecols=(1, 4),
+                skip_header=3,
+                invalid_raise=False,
+                dtype=np.float32,
+                ndmin=2,
+            )
+        data = data[~np.isnan(data).any(axis=1)]
+
+    mask = data[:, 1] >= 0
+    displacement = data[mask, 0]
+    stress = data[mask, 1]
+    strain = displacement / gauge_length_mm
 
-        parts = line.replace(",", ".").split("\t")
-        if len(parts) >= 5:
-            try:
-                displacement_mm = float(parts[1])
-                stress_mpa = float(parts[4])
+    return strain, stress
 
-                if stress_mpa >= 0:
-                    displacement_data.append(displacement_mm)
-                    stress_data.append(stress_mpa)
-            except (ValueError, IndexError):
-                continue
 
-    displacement = np.array(displacement_data)
-    stress = np.array(stress_data)
-    strain = displacement / gauge_length_mm
+def load_lis_file(
+    filepath: Path, gauge_length_mm: float = 25.0
+) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
+    """
+    Parse .lis file, reusing a .npz sidecar cache when it is newer than the source.
+    """
+    cache_path = filepath.with_suffix(".npz")
+
+    if cache_path.exists() and cache_path.stat().st_mtime >= filepath.stat().st_mtime:
+        try:
+            with open(cache_path, "rb") as f, np.load(f) as cached:
+                if (
+                    int(cached["version"]) == _CACHE_VERSION
+                    and float(cached["gauge_length_mm"]) == gauge_length_mm
+                ):
+                    return cached["strain"], cached["stress"]
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            pass
+
+    strain, stress = parse_lis_file(filepath, gauge_length_mm)
+    _write_cache(
+        cache_path,
+        strain=strain,
+        stress=stress,
+        gauge_length_mm=gauge_length_mm,
+        version=_CACHE_VERSION,
+    )
 
     return strain, stress
 
 
+def _write_cache(cache_path: Path, **arrays) -> None:
+    """
+    Atomically write a .npz cache: save to a temp file, then rename into place.
+
+    Readers never see a partially written cache, even if the run is interrupted
+    or several runs write concurrently. Failures (e.g. read-only data dir) are
+    ignored, leaving caching disabled.
+    """
+    try:
+        fd, tmp_name = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=f"{cache_path.name}.", suffix=".tmp"
+        )
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_name)
+        except OSError:
+            pass
+
+
 def load_cunisi_data() -> tuple[NDArray[np.floating], NDArray[np.floating]]:
     filepath = DATA_DIR / "Tensile_C_08.lis"
-    return parse_lis_file(filepath)
+    return load_lis_file(filepath)
 
 
 def load_cusn12_data() -> tuple[NDArray[np.floating], NDArray[np.floating]]:
     filepath = DATA_DIR / "Tensile_E_01.lis"
-    return parse_lis_file(filepath)
+    return load_lis_file(filepath)
 
 
 def load_cuni12al3_data() -> tuple[NDArray[np.floating], NDArray[np.floating]]:
     filepath = DATA_DIR / "Tensile_F_01.lis"
-    return parse_lis_file(filepath)
+    return load_lis_file(filepath)
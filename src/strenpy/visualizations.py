@@ -18,9 +18,10 @@ def plot_engineering_stress_strain(
     uts_point: tuple[float, float] | None = None,
     proportional_limit: tuple[float, float] | None = None,
     save_path: str | None = None,
+    dpi: int = 150,
 ) -> None:
     """Plot engineering stress-strain curve with key points annotated."""
-    fig, ax = plt.subplots(figsize=(10, 7))
+    fig, ax = plt.subplots(figsize=(10, 7), layout="constrained")
 
     ax.plot(strain, stress, "b-", linewidth=2.5, label=material_name)
 
@@ -93,12 +94,11 @@ def plot_engineering_stress_strain(
     ax.grid(True, alpha=0.3, linestyle="--")
     ax.legend(fontsize=10, loc="best")
 
-    plt.tight_layout()
-
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches="tight")
-
-    plt.show()
+        plt.savefig(save_path, dpi=dpi)
+        plt.close(fig)
+    else:
+        plt.show()
 
 
 def plot_engineering_vs_true(
@@ -109,9 +109,10 @@ def plot_engineering_vs_true(
     material_name: str = "Material",
     uts_idx: int | None = None,
     save_path: str | None = None,
+    dpi: int = 150,
 ) -> None:
     """Plot engineering vs true stress-strain curves on same axes."""
-    fig, ax = plt.subplots(figsize=(11, 7))
+    fig, ax = plt.subplots(figsize=(11, 7), layout="constrained")
 
     ax.plot(
         engineering_strain,
@@ -162,12 +163,11 @@ def plot_engineering_vs_true(
     ax.grid(True, alpha=0.3, linestyle="--")
     ax.legend(fontsize=10, loc="best")
 
-    plt.tight_layout()
-
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches="tight")
-
-    plt.show()
+        plt.savefig(save_path, dpi=dpi)
+        plt.close(fig)
+    else:
+        plt.show()
 
 
 def plot_power_law(
@@ -177,24 +177,25 @@ def plot_power_law(
     n: float,
     material_name: str = "Material",
     save_path: str | None = None,
+    dpi: int = 150,
 ) -> None:
     """Plot power-law fit on log-log axes."""
-    fig, ax = plt.subplots(figsize=(10, 7))
+    fig, ax = plt.subplots(figsize=(10, 7), layout="constrained")
 
     mask = (true_strain > 0) & (true_stress > 0)
+    strain_data = true_strain[mask]
+    stress_data = true_stress[mask]
 
     ax.loglog(
-        true_strain[mask],
-        true_stress[mask],
+        strain_data,
+        stress_data,
         "bo",
         markersize=6,
         alpha=0.6,
         label="Experimental data",
     )
 
-    strain_fit = np.logspace(
-        np.log10(true_strain[mask].min()), np.log10(true_strain[mask].max()), 100
-    )
+    strain_fit = np.geomspace(strain_data.min(), strain_data.max(), 100)
     stress_fit = A * (strain_fit**n)
     ax.loglog(
         strain_fit,
@@ -212,12 +213,11 @@ def plot_power_law(
     ax.grid(True, alpha=0.3, linestyle="--", which="both")
     ax.legend(fontsize=11, loc="best")
 
-    plt.tight_layout()
-
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches="tight")
-
-    plt.show()
+        plt.savefig(save_path, dpi=dpi)
+        plt.close(fig)
+    else:
+        plt.show()
 
 
 def plot_strain_energy(
@@ -226,9 +226,10 @@ def plot_strain_energy(
     yield_idx: int | None = None,
     material_name: str = "Material",
     save_path: str | None = None,
+    dpi: int = 150,
 ) -> None:
     """Plot strain energy visualization showing resilience and toughness."""
-    fig, ax = plt.subplots(figsize=(10, 7))
+    fig, ax = plt.subplots(figsize=(10, 7), layout="constrained")
 
     ax.plot(strain, stress, "b-", linewidth=2.5, label=material_name)
 
@@ -260,21 +261,21 @@ def plot_strain_energy(
     ax.grid(True, alpha=0.3, linestyle="--")
     ax.legend(fontsize=11, loc="best")
 
-    plt.tight_layout()
-
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches="tight")
-
-    plt.show()
+        plt.savefig(save_path, dpi=dpi)
+        plt.close(fig)
+    else:
+        plt.show()
 
 
 def plot_material_comparison(
     materials: dict[str, tuple[NDArray[np.floating], NDArray[np.floating]]],
     title: str = "Stress-Strain Comparison",
     save_path: str | None = None,
+    dpi: int = 150,
 ) -> None:
     """Plot multiple stress-strain curves on same axes for comparison."""
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig, ax = plt.subplots(figsize=(12, 7), layout="constrained")
 
     colors = ["blue", "red", "green", "orange", "purple", "brown"]
 
@@ -288,9 +289,8 @@ def plot_material_comparison(
     ax.grid(True, alpha=0.3, linestyle="--")
     ax.legend(fontsize=12, loc="best")
 
-    plt.tight_layout()
-
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches="tight")
-
-    plt.show()
+        plt.savefig(save_path, dpi=dpi)
+        plt.close(fig)
+    else:
+        plt.show()
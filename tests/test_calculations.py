@@ -3,15 +3,18 @@ Tests for MIT stress-strain calculations.
 """
 
 import numpy as np
+import pytest
 from strenpy.calculations import (
     calculate_cross_sectional_area,
     calculate_engineering_strain,
     calculate_engineering_stress,
     calculate_youngs_modulus,
+    calculate_youngs_moduli,
     calculate_offset_yield_stress,
     calculate_uts,
     calculate_true_stress,
     calculate_true_strain,
+    calculate_true_stress_strain,
     fit_power_law,
     calculate_strain_energy,
     calculate_modulus_of_resilience,
@@ -54,6 +57,36 @@ def test_calculate_youngs_modulus():
     assert np.isclose(calculated_E, youngs_modulus, rtol=0.01)
 
 
+def test_calculate_youngs_moduli():
+    strain = np.linspace(0, 0.005, 50)
+    moduli = [70000, 120000, 210000]
+    stresses = [E * strain + 5.0 for E in moduli]
+
+    calculated = calculate_youngs_moduli(stresses, [strain] * 3, elastic_points=40)
+    assert np.allclose(calculated, moduli, rtol=0.01)
+
+
+def test_calculate_youngs_moduli_short_curve():
+    rng = np.random.default_rng(0)
+    strains = [np.linspace(0, 0.005, 50), np.linspace(0, 0.002, 12)]
+    stresses = [210000 * s + rng.normal(0, 5, s.size) for s in strains]
+
+    calculated = calculate_youngs_moduli(stresses, strains, elastic_points=30)
+    expected = [
+        calculate_youngs_modulus(stress, strain, elastic_points=30)
+        for stress, strain in zip(stresses, strains)
+    ]
+    assert np.allclose(calculated, expected)
+
+
+def test_calculate_youngs_moduli_too_few_points():
+    strains = [np.linspace(0, 0.005, 50), np.array([0.0])]
+    stresses = [70000 * strain for strain in strains]
+
+    with pytest.raises(ValueError):
+        calculate_youngs_moduli(stresses, strains)
+
+
 def test_calculate_offset_yield_stress():
     strain = np.linspace(0, 0.05, 100)
     youngs_modulus = 70000
@@ -73,6 +106,18 @@ def test_calculate_offset_yield_stress():
     assert yield_strain >= 0.002
 
 
+def test_calculate_offset_yield_stress_no_intersection():
+    strain = np.linspace(0, 0.001, 20)
+    stress = 70000 * strain
+
+    yield_stress, yield_strain = calculate_offset_yield_stress(
+        stress, strain, 70000, offset=0.002
+    )
+
+    assert yield_stress == stress[-1]
+    assert yield_strain == strain[-1]
+
+
 def test_calculate_uts():
     stress = np.array([100, 200, 300, 400, 500, 450, 400, 350])
     uts_value, uts_idx = calculate_uts(stress)
@@ -99,6 +144,42 @@ def test_calculate_true_strain():
     assert np.allclose(true_strain, expected, atol=0.001)
 
 
+def test_calculate_true_stress_strain():
+    engineering_stress = np.array([100.0, 200.0, 300.0])
+    engineering_strain = np.array([0.0, 0.1, 0.2])
+
+    true_stress, true_strain = calculate_true_stress_strain(
+        engineering_stress, engineering_strain
+    )
+
+    assert np.allclose(
+        true_stress, calculate_true_stress(engineering_stress, engineering_strain)
+    )
+    assert np.allclose(true_strain, calculate_true_strain(engineering_strain))
+
+
+def test_calculate_true_stress_strain_integer_input():
+    engineering_stress = np.array([100, 200, 300])
+    engineering_strain = np.array([0, 1, 2])
+
+    true_stress, true_strain = calculate_true_stress_strain(
+        engineering_stress, engineering_strain
+    )
+
+    assert np.issubdtype(true_strain.dtype, np.floating)
+    assert np.allclose(
+        true_stress, calculate_true_stress(engineering_stress, engineering_strain)
+    )
+    assert np.allclose(true_strain, calculate_true_strain(engineering_strain))
+
+
+def test_calculate_true_strain_small_strain():
+    engineering_strain = np.array([1e-12, 1e-9])
+    true_strain = calculate_true_strain(engineering_strain)
+
+    assert np.allclose(true_strain, engineering_strain, rtol=1e-9, atol=0)
+
+
 def test_fit_power_law():
     true_strain = np.linspace(0.01, 0.3, 50)
     n_expected = 0.474
@@ -111,6 +192,16 @@ def test_fit_power_law():
     assert np.isclose(n_fit, n_expected, rtol=0.05)
 
 
+def test_fit_power_law_too_few_points():
+    with pytest.raises(ValueError):
+        fit_power_law(np.array([100.0]), np.array([0.1]))
+
+
+def test_fit_power_law_constant_strain():
+    with pytest.raises(ValueError):
+        fit_power_law(np.array([1.0, 2.0, 3.0]), np.array([0.1, 0.1, 0.1]))
+
+
 def test_calculate_strain_energy():
     strain = np.array([0.0, 0.01, 0.02, 0.03])
     stress = np.array([0.0, 100.0, 200.0, 300.0])
@@ -133,6 +224,22 @@ def test_calculate_modulus_of_resilience():
     assert resilience < calculate_strain_energy(stress, strain)
 
 
+def test_strain_energy_with_precomputed_increments():
+    strain = np.linspace(0, 0.05, 100)
+    stress = 100000 * strain
+    stress[20:] = stress[19]
+    dx = np.diff(strain)
+
+    assert np.isclose(
+        calculate_modulus_of_resilience(stress, strain, yield_idx=19, dx=dx),
+        np.trapezoid(stress[:20], strain[:20]),
+    )
+    assert np.isclose(
+        calculate_modulus_of_toughness(stress, strain, dx=dx),
+        np.trapezoid(stress, strain),
+    )
+
+
 def test_calculate_modulus_of_toughness():
     strain = np.linspace(0, 0.5, 100)
     stress = np.linspace(0, 400, 100)
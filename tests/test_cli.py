@@ -0,0 +1,126 @@
+"""
+Tests for CLI output helpers.
+"""
+
+import warnings
+
+import numpy as np
+from strenpy import (
+    calculate_modulus_of_resilience,
+    calculate_modulus_of_toughness,
+    calculate_offset_yield_stress,
+    calculate_true_stress_strain,
+    calculate_uts,
+    calculate_youngs_modulus,
+)
+from strenpy.cli import _write_stress_strain_csv, analyze_materials
+
+
+def _synthetic_curve(n_points: int, peak: float) -> tuple[np.ndarray, np.ndarray]:
+    strain = 0.3 * np.linspace(0.0, 1.0, n_points) ** 2
+    stress = peak * np.tanh(strain / 0.01) - 400.0 * np.clip(strain - 0.2, 0, None)
+    return strain, stress
+
+
+def test_write_stress_strain_csv_matches_savetxt(tmp_path):
+    strain = np.array([0.0, 0.0015, 0.12345678901234567, 0.5])
+    stress = np.array([0.0, 98.76, 312.5, 1e-7])
+
+    expected = tmp_path / "expected.csv"
+    np.savetxt(
+        expected,
+        np.column_stack([strain, stress]),
+        delimiter=",",
+        header="strain_e,stress_e_MPa",
+        comments="",
+    )
+    actual = tmp_path / "actual.csv"
+    _write_stress_strain_csv(actual, strain, stress)
+
+    assert actual.read_bytes() == expected.read_bytes()
+
+
+def test_write_stress_strain_csv_float32_round_trips(tmp_path):
+    strain = np.array([0.0, 0.0015, 0.1234567, 0.5], dtype=np.float32)
+    stress = np.array([0.0, 98.76, 312.5, 1e-7], dtype=np.float32)
+
+    expected = tmp_path / "expected.csv"
+    np.savetxt(
+        expected,
+        np.column_stack([strain, stress]),
+        fmt="%.9g",
+        delimiter=",",
+        header="strain_e,stress_e_MPa",
+        comments="",
+    )
+    actual = tmp_path / "actual.csv"
+    _write_stress_strain_csv(actual, strain, stress)
+
+    assert actual.read_bytes() == expected.read_bytes()
+    loaded = np.loadtxt(actual, delimiter=",", skiprows=1, dtype=np.float32)
+    np.testing.assert_array_equal(loaded[:, 0], strain)
+    np.testing.assert_array_equal(loaded[:, 1], stress)
+
+
+def test_analyze_materials_handles_unequal_lengths():
+    curves = [_synthetic_curve(120, 300.0), _synthetic_curve(200, 450.0)]
+    strains = [strain for strain, _ in curves]
+    stresses = [stress for _, stress in curves]
+
+    results = analyze_materials(["short", "long"], strains, stresses)
+
+    for result, strain, stress in zip(results, strains, stresses):
+        assert result["fracture_strain"] == strain[-1]
+        assert np.all(np.isfinite(result["strain_t"]))
+        assert np.all(np.isfinite(result["stress_t"]))
+
+        uts_idx = result["uts_idx"]
+        stress_t, strain_t = calculate_true_stress_strain(
+            stress[:uts_idx], strain[:uts_idx]
+        )
+        np.testing.assert_array_equal(result["stress_t"], stress_t)
+        np.testing.assert_array_equal(result["strain_t"], strain_t)
+
+
+def test_analyze_materials_accepts_integer_curves():
+    strain = np.arange(100) // 10
+    stress = np.arange(100) * 3
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        (result,) = analyze_materials(["int"], [strain], [stress])
+
+    assert result["fracture_strain"] == strain[-1]
+
+
+def test_analyze_materials_matches_per_curve_functions():
+    curves = [
+        _synthetic_curve(90, 250.0),
+        _synthetic_curve(240, 520.0),
+        _synthetic_curve(150, 380.0),
+    ]
+    strains = [strain for strain, _ in curves]
+    stresses = [stress for _, stress in curves]
+
+    results = analyze_materials(["a", "b", "c"], strains, stresses)
+
+    for result, strain, stress in zip(results, strains, stresses):
+        E = calculate_youngs_modulus(stress, strain, elastic_points=30)
+        yield_stress, yield_strain = calculate_offset_yield_stress(
+            stress, strain, E, offset=0.002
+        )
+        yield_idx = int(np.argmin(np.abs(strain - yield_strain)))
+        _, uts_idx = calculate_uts(stress)
+
+        assert np.isclose(result["E"], E)
+        assert result["yield_stress"] == yield_stress
+        assert result["yield_strain"] == yield_strain
+        assert result["yield_idx"] == yield_idx
+        assert result["uts_idx"] == uts_idx
+        assert np.isclose(
+            result["resilience"],
+            calculate_modulus_of_resilience(stress, strain, yield_idx),
+        )
+        assert np.isclose(
+            result["toughness"], calculate_modulus_of_toughness(stress, strain)
+        )
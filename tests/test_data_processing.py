@@ -0,0 +1,88 @@
+"""
+Tests for .lis file parsing.
+"""
+
+import numpy as np
+import pytest
+from strenpy import data_processing
+from strenpy.data_processing import load_lis_file, parse_lis_file
+
+
+LIS_CONTENT = (
+    "BAM 5.2 *ZUG01-V03* TEST.lis\r\n"
+    "Werkstoff\t\t\t\tCuNiSi\r\n"
+    "[Daten]\r\n"
+    "Zeit\tWeg\tKraft\tDehnung\tSpannung\r\n"
+    "sec\tmm\tkN\t%\tMPa\r\n"
+    "0\t0\t0,1\t0,008\t5,0\r\n"
+    "0,05\t0,25\t0,2\t0,009\t10,5\r\n"
+    "\r\n"
+    "0,10\t0,5\t0,3\t0,010\t-2,0\r\n"
+)
+
+
+def test_parse_lis_file(tmp_path):
+    filepath = tmp_path / "test.lis"
+    filepath.write_bytes(LIS_CONTENT.encode("latin-1"))
+
+    strain, stress = parse_lis_file(filepath, gauge_length_mm=25.0)
+
+    assert strain.dtype == np.float32
+    assert stress.dtype == np.float32
+    assert np.allclose(strain, [0.0, 0.01])
+    assert np.allclose(stress, [5.0, 10.5])
+
+
+def test_parse_lis_file_skips_malformed_rows(tmp_path):
+    filepath = tmp_path / "test.lis"
+    content = LIS_CONTENT + "0,15\tn/a\t0,4\t0,011\t20,0\r\n0,20\t1,0\r\n"
+    filepath.write_bytes(content.encode("latin-1"))
+
+    strain, stress = parse_lis_file(filepath, gauge_length_mm=25.0)
+
+    assert np.allclose(strain, [0.0, 0.01])
+    assert np.allclose(stress, [5.0, 10.5])
+
+
+def test_parse_lis_file_missing_data_section(tmp_path):
+    filepath = tmp_path / "test.lis"
+    filepath.write_bytes(b"BAM 5.2\r\nno data here\r\n")
+
+    with pytest.raises(ValueError):
+        parse_lis_file(filepath)
+
+
+def test_load_lis_file_writes_and_reuses_cache(tmp_path, monkeypatch):
+    filepath = tmp_path / "test.lis"
+    filepath.write_bytes(LIS_CONTENT.encode("latin-1"))
+
+    strain, stress = load_lis_file(filepath)
+    assert filepath.with_suffix(".npz").exists()
+    assert list(tmp_path.glob("*.tmp")) == []
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("cache was not reused")
+
+    with monkeypatch.context() as m:
+        m.setattr(data_processing, "parse_lis_file", fail_parse)
+        cached_strain, cached_stress = load_lis_file(filepath)
+    assert np.array_equal(cached_strain, strain)
+    assert np.array_equal(cached_stress, stress)
+
+    rescaled_strain, _ = load_lis_file(filepath, gauge_length_mm=50.0)
+    assert np.allclose(rescaled_strain, strain / 2)
+
+
+def test_load_lis_file_reparses_truncated_cache(tmp_path):
+    filepath = tmp_path / "test.lis"
+    filepath.write_bytes(LIS_CONTENT.encode("latin-1"))
+    strain, stress = load_lis_file(filepath)
+
+    cache_path = filepath.with_suffix(".npz")
+    cache_bytes = cache_path.read_bytes()
+    cache_path.write_bytes(cache_bytes[: len(cache_bytes) // 2])
+
+    reparsed_strain, reparsed_stress = load_lis_file(filepath)
+    assert np.array_equal(reparsed_strain, strain)
+    assert np.array_equal(reparsed_stress, stress)
+    assert cache_path.read_bytes() == cache_bytes